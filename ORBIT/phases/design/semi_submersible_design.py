@@ -5,6 +5,8 @@ __copyright__ = "Copyright 2020, National Renewable Energy Laboratory"
 __maintainer__ = "Jake Nunemaker"
 __email__ = "jake.nunemaker@nrel.gov"
 
+from functools import cached_property
+
 from ORBIT.phases.design import DesignPhase
 
 """
@@ -63,7 +65,7 @@ class SemiSubmersibleDesign(DesignPhase):
 
         self._outputs["substructure"] = substructure
 
-    @property
+    @cached_property
     def stiffened_column_mass(self):
         """Calculates the mass of the stiffened column for a single
         semi-submersible in tonnes [1].
@@ -75,7 +77,7 @@ class SemiSubmersibleDesign(DesignPhase):
 
         return mass
 
-    @property
+    @cached_property
     def stiffened_column_cost(self):
         """Calculates the cost of the stiffened column for a single
         semi-submersible [1].
@@ -87,7 +89,7 @@ class SemiSubmersibleDesign(DesignPhase):
         )
         return self.stiffened_column_mass * cr
 
-    @property
+    @cached_property
     def truss_mass(self):
         """Calculates the truss mass for a single semi-submersible in tonnes
         [1].
@@ -99,7 +101,7 @@ class SemiSubmersibleDesign(DesignPhase):
 
         return mass
 
-    @property
+    @cached_property
     def truss_cost(self):
         """Calculates the cost of the truss for a signle semi-submerisble
         [1].
@@ -111,7 +113,7 @@ class SemiSubmersibleDesign(DesignPhase):
         )
         return self.truss_mass * cr
 
-    @property
+    @cached_property
     def heave_plate_mass(self):
         """Calculates the heave plate mass for a single semi-submersible
         in tonnes [1].
@@ -123,7 +125,7 @@ class SemiSubmersibleDesign(DesignPhase):
 
         return mass
 
-    @property
+    @cached_property
     def heave_plate_cost(self):
         """Calculates the heave plate cost for a single semi-submersible
         [1].
@@ -135,7 +137,7 @@ class SemiSubmersibleDesign(DesignPhase):
         )
         return self.heave_plate_mass * cr
 
-    @property
+    @cached_property
     def secondary_steel_mass(self):
         """Calculates the mass of the required secondary steel for a single
         semi-submersible [1].
@@ -147,7 +149,7 @@ class SemiSubmersibleDesign(DesignPhase):
 
         return mass
 
-    @property
+    @cached_property
     def secondary_steel_cost(self):
         """Calculates the cost of the required secondary steel for a single
         semi-submersible [1].
@@ -159,7 +161,7 @@ class SemiSubmersibleDesign(DesignPhase):
         )
         return self.secondary_steel_mass * cr
 
-    @property
+    @cached_property
     def substructure_mass(self):
         """Returns single substructure mass."""
 
@@ -170,7 +172,7 @@ class SemiSubmersibleDesign(DesignPhase):
             + self.secondary_steel_mass
         )
 
-    @property
+    @cached_property
     def substructure_cost(self):
         """Returns single substructure cost."""
 